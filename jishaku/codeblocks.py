@@ -11,7 +11,6 @@ Converters for detecting and obtaining codeblock content
 
 """
 
-import collections
 import typing
 
 __all__ = ('Codeblock', 'codeblock_converter')
@@ -33,39 +32,37 @@ def codeblock_converter(argument: str) -> Codeblock:
     Returns a namedtuple of (language, content).
 
     :attr:`Codeblock.language` is an empty string if no language was given with this codeblock.
-    It is ``None`` if the input was not a complete codeblock.
+    It is ``None`` if the input was not a complete codeblock, including when anything but whitespace follows the closing fence,
+    in which case :attr:`Codeblock.content` is the unmodified input.
     """
-    if not argument.startswith('`'):
+    if not argument or argument[0] != '`':
         return Codeblock(None, argument)
 
-    # keep a small buffer of the last chars we've seen
-    last: typing.Deque[str] = collections.deque(maxlen=3)
-    backticks = 0
-    in_language = False
-    in_code = False
-    language: typing.List[str] = []
-    code: typing.List[str] = []
-
-    for char in argument:
-        if char == '`' and not in_code and not in_language:
-            backticks += 1  # to help keep track of closing backticks
-        if last and last[-1] == '`' and char != '`' or in_code and ''.join(last) != '`' * backticks:
-            in_code = True
-            code.append(char)
-        if char == '\n':  # \n delimits language and code
-            in_language = False
-            in_code = True
-        # we're not seeing a newline yet but we also passed the opening ```
-        elif ''.join(last) == '`' * 3 and char != '`':
-            in_language = True
-            language.append(char)
-        elif in_language:  # we're in the language after the first non-backtick character
-            if char != '\n':
-                language.append(char)
-
-        last.append(char)
-
-    if not code and not language:
-        code[:] = last
-
-    return Codeblock(''.join(language), ''.join(code[len(language):-backticks]))
+    backticks = len(argument) - len(argument.lstrip('`'))
+
+    if backticks >= 3:
+        # the closing fence is the final run of backticks, which must be at least as long as the opening one;
+        # any extra backticks in it are part of the fence rather than the content
+        stripped = argument.rstrip()
+        close = len(stripped.rstrip('`'))
+
+        if close < backticks or len(stripped) - close < backticks:
+            return Codeblock(None, argument)
+
+        # ```language\ncontent```, where the language line is optional
+        newline = argument.find('\n', backticks, close)
+
+        if newline != -1 and '`' not in argument[backticks:newline]:
+            return Codeblock(argument[backticks:newline], argument[newline + 1:close])
+
+        return Codeblock('', argument[backticks:close])
+
+    # search from the end so backticks within the content don't close the codeblock early
+    close = argument.rfind('`' * backticks, backticks)
+
+    # anything other than whitespace after the closing fence means this isn't one complete codeblock
+    if close == -1 or argument[close + backticks:].strip():
+        return Codeblock(None, argument)
+
+    # `content` or ``content``
+    return Codeblock('', argument[backticks:close])
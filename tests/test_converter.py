@@ -112,3 +112,75 @@ def test_codeblock_converter():
     assert isinstance(codeblock, Codeblock)
     assert codeblock.content.strip() == 'nine'
     assert not codeblock.language
+
+    text = "```py\nten"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == text
+    assert codeblock.language is None
+
+    text = "```print('eleven')```"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == "print('eleven')"
+    assert not codeblock.language
+
+    text = "`ls` && echo twelve"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == text
+    assert codeblock.language is None
+
+    text = "``thir``teen"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == text
+    assert codeblock.language is None
+
+    text = "```py\nprint('```')\nfourteen()"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == text
+    assert codeblock.language is None
+
+    text = "```py\nfifteen\n```\n"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == "fifteen\n"
+    assert codeblock.language == 'py'
+
+    text = "````py\nsixteen````"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == "sixteen"
+    assert codeblock.language == 'py'
+
+    text = "````py\nseventeen```"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == text
+    assert codeblock.language is None
+
+    text = "```py\neighteen\n````"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == "eighteen\n"
+    assert codeblock.language == 'py'
+
+    text = "````py\nnineteen`````"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == "nineteen"
+    assert codeblock.language == 'py'
+
+    text = "`echo `twenty``"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == "echo `twenty`"
+    assert not codeblock.language
+
+    text = "```py\nprint(1)\n```"
+    codeblock = codeblock_converter(text)
+    assert isinstance(codeblock, Codeblock)
+    assert codeblock.content == "print(1)\n"
+    assert codeblock.language == 'py'